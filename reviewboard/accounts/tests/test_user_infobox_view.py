@@ -13,9 +13,8 @@ class UserInfoboxViewTests(TestCase):
 
     def test_unicode(self):
         """Testing UserInfoboxView with a user with non-ascii characters"""
-        user = User.objects.create_user('test', 'test@example.com')
-        user.first_name = 'Test\u21b9'
-        user.last_name = 'User\u2729'
-        user.save()
+        User.objects.create_user('test', 'test@example.com',
+                                 first_name='Test\u21b9',
+                                 last_name='User\u2729')
 
         self.client.get(local_site_reverse('user-infobox', args=['test']))
@@ -3,40 +3,143 @@
 
 from __future__ import unicode_literals
 
+import copy
 import struct
 
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import six
 from djblets.testing.decorators import add_fixtures
+from djblets.util.decorators import cached_property
 
-from reviewboard.site.urlresolvers import local_site_reverse
+from reviewboard.diffviewer.models import FileDiff
+from reviewboard.reviews.models import Review, ReviewRequest
 from reviewboard.testing import TestCase
 
 
+#: The header for each fragment: the comment ID and the length of the HTML.
+_FRAGMENT_HEADER = struct.Struct(b'<LL')
+
+
+def _iter_fragments(content):
+    """Iterate through the fragments in a payload from the view.
+
+    Each fragment is only decoded once the caller asks for it.
+
+    Args:
+        content (bytes):
+            The payload to parse.
+
+    Yields:
+        tuple:
+        A 2-tuple of ``(comment_id, html)`` for each fragment.
+    """
+    # The HTML is sliced out of the payload as bytes and then decoded. On
+    # both Python 2 and 3, this is at least as fast as decoding from a
+    # memoryview.
+    content_len = len(content)
+    header_size = _FRAGMENT_HEADER.size
+    unpack_header = _FRAGMENT_HEADER.unpack_from
+    i = 0
+
+    while i < content_len:
+        # Read the comment ID and the length of the HTML.
+        comment_id, html_len = unpack_header(content, i)
+        i += header_size
+
+        # Read the HTML.
+        html = content[i:i + html_len].decode('utf-8')
+        i += html_len
+
+        yield comment_id, html
+
+
 class CommentDiffFragmentsViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.CommentDiffFragmentsView."""
 
     fixtures = ['test_users', 'test_scmtools']
+    load_fixtures_once = True
+
+    #: URL format strings for the view, keyed by Local Site name.
+    _fragments_url_formats = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        super(CommentDiffFragmentsViewTests, cls).setUpTestData()
+
+        helper = cls.get_data_helper()
+
+        # Two published review requests with a diff, which tests can make
+        # comments on. Tests fetch their own copies of these.
+        review_request = helper.create_review_request(create_repository=True,
+                                                      publish=True)
+        diffset = helper.create_diffset(review_request)
+        cls.review_request_id = review_request.pk
+        cls.filediff_id = helper.create_filediff(diffset).pk
+
+        review_request = helper.create_review_request(create_repository=True,
+                                                      publish=True)
+        diffset = helper.create_diffset(review_request)
+        cls.review_request2_id = review_request.pk
+        cls.filediff2_id = helper.create_filediff(diffset).pk
+
+        # An unpublished review request with a diff, for access checks.
+        review_request = helper.create_review_request(create_repository=True)
+        diffset = helper.create_diffset(review_request)
+        cls.unpublished_review_request_id = review_request.pk
+        cls.unpublished_filediff_id = helper.create_filediff(diffset).pk
+
+        # Tests log in with force_login(), so users in this suite are
+        # created without a password. This gives them an unusable password
+        # without running the password hasher.
+        cls.shared_reviewer = User.objects.create_user(
+            username='reviewer',
+            email='reviewer@example.com')
+        cls.shared_site_user = User.objects.create_user(
+            username='test-user',
+            email='user@example.com')
+
+    # The following are only fetched or copied for the tests that use them.
+    # force_login() sets last_login and the auth backend on the user it is
+    # given, so tests work with copies of the shared users.
+
+    @cached_property
+    def reviewer(self):
+        """This test's copy of the shared reviewer."""
+        return copy.copy(self.shared_reviewer)
+
+    @cached_property
+    def site_user(self):
+        """This test's copy of the shared Local Site user."""
+        return copy.copy(self.shared_site_user)
+
+    @cached_property
+    def review_request(self):
+        """This test's copy of the first published review request."""
+        return ReviewRequest.objects.get(pk=self.review_request_id)
+
+    @cached_property
+    def filediff(self):
+        """This test's copy of the first review request's FileDiff."""
+        return FileDiff.objects.get(pk=self.filediff_id)
 
     def test_get_with_unpublished_review_request_not_owner(self):
         """Testing CommentDiffFragmentsView with unpublished review request and
         user is not the owner
         """
-        user = User.objects.create_user(username='reviewer',
-                                        password='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        review_request = self.create_review_request(create_repository=True)
-        diffset = self.create_diffset(review_request)
-        filediff = self.create_filediff(diffset)
+        review_request = \
+            ReviewRequest.objects.get(pk=self.unpublished_review_request_id)
+        filediff = FileDiff.objects.get(pk=self.unpublished_filediff_id)
 
         review = self.create_review(review_request, user=user)
         comment1 = self.create_diff_comment(review, filediff)
         comment2 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
-        self.assertTrue(self.client.login(username='reviewer',
-                                          password='reviewer'))
+        self.client.force_login(user)
 
         self._get_fragments(review_request,
                             [comment1.pk, comment2.pk],
@@ -46,22 +149,17 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with unpublished review request and
         user is the owner
         """
-        user = User.objects.create_user(username='test-user',
-                                        password='test-user',
-                                        email='user@example.com')
-
-        review_request = self.create_review_request(create_repository=True,
-                                                    submitter=user)
-        diffset = self.create_diffset(review_request)
-        filediff = self.create_filediff(diffset)
+        review_request = \
+            ReviewRequest.objects.get(pk=self.unpublished_review_request_id)
+        filediff = FileDiff.objects.get(pk=self.unpublished_filediff_id)
+        user = review_request.submitter
 
         review = self.create_review(review_request, user=user)
         comment1 = self.create_diff_comment(review, filediff)
         comment2 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
-        self.assertTrue(self.client.login(username='test-user',
-                                          password='test-user'))
+        self.client.force_login(user)
 
         fragments = self._get_fragments(review_request,
                                         [comment1.pk, comment2.pk])
@@ -74,9 +172,7 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with published review request on
         a Local Site the user has access to
         """
-        user = User.objects.create_user(username='test-user',
-                                        password='test-user',
-                                        email='user@example.com')
+        user = self.site_user
 
         review_request = self.create_review_request(create_repository=True,
                                                     with_local_site=True,
@@ -87,12 +183,11 @@ class CommentDiffFragmentsViewTests(TestCase):
         review = self.create_review(review_request)
         comment1 = self.create_diff_comment(review, filediff)
         comment2 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
         review_request.local_site.users.add(user)
 
-        self.assertTrue(self.client.login(username='test-user',
-                                          password='test-user'))
+        self.client.force_login(user)
 
         fragments = self._get_fragments(review_request,
                                         [comment1.pk, comment2.pk],
@@ -106,9 +201,7 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with published review request on
         a Local Site the user does not have access to
         """
-        User.objects.create_user(username='test-user',
-                                 password='test-user',
-                                 email='user@example.com')
+        user = self.site_user
 
         review_request = self.create_review_request(create_repository=True,
                                                     with_local_site=True,
@@ -119,10 +212,9 @@ class CommentDiffFragmentsViewTests(TestCase):
         review = self.create_review(review_request)
         comment1 = self.create_diff_comment(review, filediff)
         comment2 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
-        self.assertTrue(self.client.login(username='test-user',
-                                          password='test-user'))
+        self.client.force_login(user)
 
         self._get_fragments(review_request,
                             [comment1.pk, comment2.pk],
@@ -131,7 +223,7 @@ class CommentDiffFragmentsViewTests(TestCase):
 
     def test_get_with_unicode(self):
         """Testing CommentDiffFragmentsView with Unicode content"""
-        user = User.objects.create(username='reviewer')
+        user = self.reviewer
 
         repository = self.create_repository(tool_name='Test')
         review_request = self.create_review_request(repository=repository,
@@ -174,13 +266,10 @@ class CommentDiffFragmentsViewTests(TestCase):
 
     def test_get_with_valid_comment_ids(self):
         """Testing CommentDiffFragmentsView with valid comment ID"""
-        user = User.objects.create_user(username='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
-        diffset = self.create_diffset(review_request)
-        filediff = self.create_filediff(diffset)
+        review_request = self.review_request
+        filediff = self.filediff
 
         review = self.create_review(review_request, user=user)
         comment1 = self.create_diff_comment(review, filediff)
@@ -197,28 +286,55 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with mix of valid comment IDs and
         comment IDs not found in database
         """
-        user = User.objects.create_user(username='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
-        diffset = self.create_diffset(review_request)
-        filediff = self.create_filediff(diffset)
+        review_request = self.review_request
+        filediff = self.filediff
 
         review = self.create_review(review_request, user=user)
         comment = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
         fragments = self._get_fragments(review_request, [999, comment.pk])
         self.assertEqual(len(fragments), 1)
         self.assertEqual(fragments[0][0], comment.pk)
 
+    def test_get_query_count_with_many_comments(self):
+        """Testing CommentDiffFragmentsView query count doesn't grow with the
+        number of comments, or with comment IDs not found in database
+        """
+        review_request = self.review_request
+        review = self.create_review(review_request, user=self.reviewer)
+        comments = [
+            self.create_diff_comment(review, self.filediff, first_line=i)
+            for i in range(1, 4)
+        ]
+        self._make_review_public(review)
+
+        self._check_query_count_per_comment(review_request, comments)
+
+    def test_get_query_count_with_many_interdiff_comments(self):
+        """Testing CommentDiffFragmentsView query count doesn't grow with the
+        number of comments made on an interdiff
+        """
+        review_request = self.review_request
+        diffset = self.create_diffset(review_request, revision=2)
+        interfilediff = self.create_filediff(diffset)
+
+        review = self.create_review(review_request, user=self.reviewer)
+        comments = [
+            self.create_diff_comment(review, self.filediff,
+                                     interfilediff=interfilediff,
+                                     first_line=i)
+            for i in range(1, 4)
+        ]
+        self._make_review_public(review)
+
+        self._check_query_count_per_comment(review_request, comments)
+
     def test_get_with_no_valid_comment_ids(self):
         """Testing CommentDiffFragmentsView with no valid comment IDs"""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
-
-        self._get_fragments(review_request,
+        self._get_fragments(self.review_request,
                             [100, 200, 300],
                             expected_status=404)
 
@@ -226,28 +342,24 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with comment ID from another review
         request
         """
-        user = User.objects.create_user(username='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        # Create the first review request and review.
-        review_request1 = self.create_review_request(create_repository=True,
-                                                     publish=True)
-        diffset = self.create_diffset(review_request1)
-        filediff = self.create_filediff(diffset)
+        # Create the review on the first review request.
+        review_request1 = self.review_request
+        filediff = self.filediff
 
         review = self.create_review(review_request1, user=user)
         comment1 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
-        # Create the second review request and review.
-        review_request2 = self.create_review_request(create_repository=True,
-                                                     publish=True)
-        diffset = self.create_diffset(review_request2)
-        filediff = self.create_filediff(diffset)
+        # Create the review on the second review request.
+        review_request2 = \
+            ReviewRequest.objects.get(pk=self.review_request2_id)
+        filediff = FileDiff.objects.get(pk=self.filediff2_id)
 
         review = self.create_review(review_request2, user=user)
         comment2 = self.create_diff_comment(review, filediff)
-        review.publish()
+        self._make_review_public(review)
 
         fragments = self._get_fragments(review_request1,
                                         [comment1.pk, comment2.pk])
@@ -258,20 +370,15 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with comment ID from draft review,
         accessed by the review's owner
         """
-        user = User.objects.create_user(username='reviewer',
-                                        password='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        review_request1 = self.create_review_request(create_repository=True,
-                                                     publish=True)
-        diffset = self.create_diffset(review_request1)
-        filediff = self.create_filediff(diffset)
+        review_request1 = self.review_request
+        filediff = self.filediff
 
         review = self.create_review(review_request1, user=user)
         comment = self.create_diff_comment(review, filediff)
 
-        self.assertTrue(self.client.login(username='reviewer',
-                                          password='reviewer'))
+        self.client.force_login(user)
 
         fragments = self._get_fragments(review_request1, [comment.pk])
         self.assertEqual(len(fragments), 1)
@@ -281,13 +388,10 @@ class CommentDiffFragmentsViewTests(TestCase):
         """Testing CommentDiffFragmentsView with comment ID from draft review,
         accessed by someone other than the review's owner
         """
-        user = User.objects.create_user(username='reviewer',
-                                        email='reviewer@example.com')
+        user = self.reviewer
 
-        review_request1 = self.create_review_request(create_repository=True,
-                                                     publish=True)
-        diffset = self.create_diffset(review_request1)
-        filediff = self.create_filediff(diffset)
+        review_request1 = self.review_request
+        filediff = self.filediff
 
         review = self.create_review(review_request1, user=user)
         comment = self.create_diff_comment(review, filediff)
@@ -296,6 +400,97 @@ class CommentDiffFragmentsViewTests(TestCase):
                             [comment.pk],
                             expected_status=404)
 
+    def _check_query_count_per_comment(self, review_request, comments):
+        """Check that loading more comments doesn't cost more queries.
+
+        This compares the number of queries needed to load fragments for
+        the first comment against those needed to load all of the comments,
+        both on their own and mixed with IDs that don't exist.
+
+        Args:
+            review_request (reviewboard.reviews.models.review_request.
+                            ReviewRequest):
+                The review request the comments were made on.
+
+            comments (list of reviewboard.reviews.models.diff_comment.
+                      Comment):
+                The public comments to load. There must be more than one.
+
+        Raises:
+            AssertionError:
+                The number of queries differed.
+        """
+        comment_ids = [comment.pk for comment in comments]
+        mixed_ids = []
+
+        for comment_id in comment_ids:
+            mixed_ids += [comment_id, comment_id + 1000]
+
+        # Make sure any caches are populated before counting queries.
+        self._get_fragments(review_request, comment_ids)
+
+        with CaptureQueriesContext(connection) as one_comment_queries:
+            fragments = self._get_fragments(review_request, comment_ids[:1])
+
+        self.assertEqual(len(fragments), 1)
+
+        with CaptureQueriesContext(connection) as all_comments_queries:
+            fragments = self._get_fragments(review_request, comment_ids)
+
+        self.assertEqual(len(fragments), len(comment_ids))
+
+        with CaptureQueriesContext(connection) as mixed_ids_queries:
+            fragments = self._get_fragments(review_request, mixed_ids)
+
+        self.assertEqual(len(fragments), len(comment_ids))
+
+        self.assertEqual(len(all_comments_queries), len(one_comment_queries))
+        self.assertEqual(len(mixed_ids_queries), len(one_comment_queries))
+
+    def _make_review_public(self, review):
+        """Make a review public without publishing it.
+
+        This is enough for the review's comments to be visible to other
+        users. It skips the work done by
+        :py:meth:`Review.publish()
+        <reviewboard.reviews.models.review.Review.publish>`, such as
+        updating timestamps and emitting signals, which most of these tests
+        don't depend on.
+
+        Args:
+            review (reviewboard.reviews.models.review.Review):
+                The review to make public.
+        """
+        Review.objects.filter(pk=review.pk).update(public=True)
+        review.public = True
+
+    @classmethod
+    def _get_fragments_url_format(cls, local_site_name=None):
+        """Return a format string for the fragments view's URL.
+
+        The URL is only reversed once for each Local Site. The resulting
+        format string takes the review request's display ID and the
+        comma-separated comment IDs.
+
+        Args:
+            local_site_name (unicode, optional):
+                The name of the Local Site for the URL.
+
+        Returns:
+            unicode:
+            The format string for the URL.
+        """
+        try:
+            return cls._fragments_url_formats[local_site_name]
+        except KeyError:
+            url_format = cls.get_url_format(
+                'diff-comment-fragments',
+                ['review_request_id', 'comment_ids'],
+                local_site_name=local_site_name)
+            cls._fragments_url_formats[local_site_name] = url_format
+
+            return url_format
+
     def _get_fragments(self, review_request, comment_ids,
                        local_site_name=None, expected_status=200):
         """Load and return fragments from the server.
@@ -318,43 +513,30 @@ class CommentDiffFragmentsViewTests(TestCase):
         Returns:
             list of tuple:
             A list of ``(comment_id, html)`` from the parsed payload, if
-            the status code was 200.
+            the status code was 200. If ``comment_ids`` is empty, this will
+            be an empty list, and no request will be made, since the URL
+            requires at least one comment ID.
+
+        Raises:
+            ValueError:
+                ``comment_ids`` was empty, but a status other than 200 was
+                expected. That status can't be checked without a request.
         """
+        if not comment_ids:
+            if expected_status != 200:
+                raise ValueError('An empty list of comment IDs cannot be '
+                                 'checked for HTTP %s.' % expected_status)
+
+            return []
+
         response = self.client.get(
-            local_site_reverse(
-                'diff-comment-fragments',
-                kwargs={
-                    'review_request_id': review_request.display_id,
-                    'comment_ids': ','.join(
-                        six.text_type(comment_id)
-                        for comment_id in comment_ids
-                    ),
-                },
-                local_site_name=local_site_name))
+            self._get_fragments_url_format(local_site_name) % (
+                review_request.display_id,
+                ','.join(map(six.text_type, comment_ids)),
+            ))
         self.assertEqual(response.status_code, expected_status)
 
         if expected_status != 200:
             return None
 
-        content = response.content
-        self.assertIs(type(content), bytes)
-
-        i = 0
-        results = []
-
-        while i < len(content):
-            # Read the comment ID.
-            comment_id = struct.unpack_from('<L', content, i)[0]
-            i += 4
-
-            # Read the length of the HTML.
-            html_len = struct.unpack_from('<L', content, i)[0]
-            i += 4
-
-            # Read the HTML.
-            html = content[i:i + html_len].decode('utf-8')
-            i += html_len
-
-            results.append((comment_id, html))
-
-        return results
+        return list(_iter_fragments(response.content))
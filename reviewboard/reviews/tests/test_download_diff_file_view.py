@@ -2,11 +2,9 @@
 
 from __future__ import unicode_literals
 
-from reviewboard.extensions.tests import TestService
 from reviewboard.hostingsvcs.models import HostingServiceAccount
 from reviewboard.hostingsvcs.service import (register_hosting_service,
                                              unregister_hosting_service)
-from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.testing import TestCase
 
 
@@ -14,45 +12,71 @@ class DownloadDiffFileViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.DownloadDiffFileView."""
 
     fixtures = ['test_users', 'test_scmtools']
+    load_fixtures_once = True
 
     @classmethod
     def setUpClass(cls):
-        super(DownloadDiffFileViewTests, cls).setUpClass()
-
+        # Reverse the URLs once, turning them into format strings that tests
+        # can fill in with the review request, diff revision, and FileDiff
+        # IDs. This doesn't need the database, so it's done before anything
+        # that would need cleaning up if it failed.
+        url_kwargs = ['review_request_id', 'revision', 'filediff_id']
+        cls.orig_url_format = cls.get_url_format('download-orig-file',
+                                                 url_kwargs)
+        cls.modified_url_format = cls.get_url_format('download-modified-file',
+                                                     url_kwargs)
+
+        # This is imported here, rather than at module level, to avoid
+        # pulling in the extension test suite (and everything it imports)
+        # just to load this module.
+        from reviewboard.extensions.tests import TestService
+
+        # The hosting service is registered before the parent class sets up
+        # the test data, so that it's available to setUpTestData(). If that
+        # fails, tearDownClass() won't be called, so unregister it here.
+        cls.hosting_service = TestService
         register_hosting_service(TestService.hosting_service_id, TestService)
 
+        try:
+            super(DownloadDiffFileViewTests, cls).setUpClass()
+        except Exception:
+            unregister_hosting_service(TestService.hosting_service_id)
+            raise
+
     @classmethod
     def tearDownClass(cls):
         super(DownloadDiffFileViewTests, cls).tearDownClass()
 
-        unregister_hosting_service(TestService.hosting_service_id)
+        unregister_hosting_service(cls.hosting_service.hosting_service_id)
+
+    @classmethod
+    def setUpTestData(cls):
+        super(DownloadDiffFileViewTests, cls).setUpTestData()
 
-    def setUp(self):
-        super(DownloadDiffFileViewTests, self).setUp()
+        helper = cls.get_data_helper()
 
-        self.account = HostingServiceAccount.objects.create(
-            service_name=TestService.name,
+        account = HostingServiceAccount.objects.create(
+            service_name=cls.hosting_service.name,
             hosting_url='http://example.com/',
             username='foo')
 
-        self.repository = self.create_repository(hosting_account=self.account)
-        self.review_request = self.create_review_request(
-            repository=self.repository, publish=True)
-        self.diffset = self.create_diffset(review_request=self.review_request)
-        self.filediff = self.create_filediff(self.diffset,
-                                             source_file='/invalid-path',
-                                             dest_file='/invalid-path')
+        repository = helper.create_repository(hosting_account=account)
+        cls.review_request = helper.create_review_request(
+            repository=repository, publish=True)
+        cls.diffset = helper.create_diffset(review_request=cls.review_request)
+        cls.filediff = helper.create_filediff(cls.diffset,
+                                              source_file='/invalid-path',
+                                              dest_file='/invalid-path')
 
     def testing_download_orig_file_404(self):
         """Testing DownloadDiffFileView with original file when the file
         cannot be found upstream
         """
-        rsp = self.client.get(
-            local_site_reverse('download-orig-file', kwargs={
-                'review_request_id': self.review_request.display_id,
-                'revision': self.diffset.revision,
-                'filediff_id': self.filediff.pk,
-            }))
+        rsp = self.client.get(self.orig_url_format % (
+            self.review_request.display_id,
+            self.diffset.revision,
+            self.filediff.pk,
+        ))
 
         self.assertEquals(rsp.status_code, 404)
 
@@ -60,11 +84,10 @@ class DownloadDiffFileViewTests(TestCase):
         """Testing DownloadDiffFileView with modified file when the file
         cannot be found upstream
         """
-        rsp = self.client.get(
-            local_site_reverse('download-modified-file', kwargs={
-                'review_request_id': self.review_request.display_id,
-                'revision': self.diffset.revision,
-                'filediff_id': self.filediff.pk,
-            }))
+        rsp = self.client.get(self.modified_url_format % (
+            self.review_request.display_id,
+            self.diffset.revision,
+            self.filediff.pk,
+        ))
 
         self.assertEquals(rsp.status_code, 404)
@@ -2,22 +2,45 @@
 
 from __future__ import unicode_literals
 
+from kgb import SpyAgency
+
+from reviewboard.diffviewer.parser import DiffParser
+from reviewboard.reviews.models import ReviewRequest
 from reviewboard.testing import TestCase
 
 
-class DownloadRawDiffViewTests(TestCase):
+class DownloadRawDiffViewTests(SpyAgency, TestCase):
     """Unit tests for reviewboard.reviews.views.DownloadRawDiffView."""
 
     fixtures = ['test_users', 'test_scmtools']
+    load_fixtures_once = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super(DownloadRawDiffViewTests, cls).setUpTestData()
+
+        cls.review_request_id = cls.get_data_helper().create_review_request(
+            create_repository=True,
+            publish=True).pk
+
+    def setUp(self):
+        super(DownloadRawDiffViewTests, self).setUp()
+
+        self.review_request = \
+            ReviewRequest.objects.get(pk=self.review_request_id)
 
     # Bug #3384
     def test_sends_correct_content_disposition(self):
         """Testing DownloadRawDiffView sends correct Content-Disposition"""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
 
         self.create_diffset(review_request=review_request)
 
+        # Only the headers matter here, so skip building the diff.
+        self.spy_on(DiffParser.raw_diff,
+                    owner=DiffParser,
+                    call_fake=lambda *args, **kwargs: b'')
+
         response = self.client.get('/r/%d/diff/raw/' % review_request.pk)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response['Content-Disposition'],
@@ -26,12 +49,16 @@ class DownloadRawDiffViewTests(TestCase):
     # Bug #3704
     def test_normalize_commas_in_filename(self):
         """Testing DownloadRawDiffView removes commas in filename"""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
 
         # Create a diffset with a comma in its name.
         self.create_diffset(review_request=review_request, name='test, comma')
 
+        # Only the headers matter here, so skip building the diff.
+        self.spy_on(DiffParser.raw_diff,
+                    owner=DiffParser,
+                    call_fake=lambda *args, **kwargs: b'')
+
         response = self.client.get('/r/%d/diff/raw/' % review_request.pk)
         content_disposition = response['Content-Disposition']
         filename = content_disposition[len('attachment; filename='):]
@@ -41,8 +68,7 @@ class DownloadRawDiffViewTests(TestCase):
         """Testing DiffParser.raw_diff with commit history contains only
         cumulative diff
         """
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
         diffset = self.create_diffset(review_request=review_request)
 
         self.create_diffcommit(
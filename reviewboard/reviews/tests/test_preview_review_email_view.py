@@ -10,75 +10,62 @@ class PreviewReviewEmailViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.PreviewReviewEmailView."""
 
     fixtures = ['test_users', 'test_scmtools']
+    load_fixtures_once = True
 
-    def test_access_with_debug(self):
-        """Testing PreviewReviewEmailView access with DEBUG=True"""
-        review_request = self.create_review_request(publish=True)
-        review = self.create_review(review_request, publish=True)
+    @classmethod
+    def setUpTestData(cls):
+        super(PreviewReviewEmailViewTests, cls).setUpTestData()
 
-        with self.settings(DEBUG=True):
-            response = self.client.get(
-                local_site_reverse(
-                    'preview-review-email',
-                    kwargs={
-                        'review_request_id': review_request.pk,
-                        'review_id': review.pk,
-                        'message_format': 'text',
-                    }))
+        helper = cls.get_data_helper()
 
-        self.assertEqual(response.status_code, 200)
+        cls.review_request = helper.create_review_request(publish=True)
+        cls.review = helper.create_review(cls.review_request, publish=True)
+        cls.reply = helper.create_reply(cls.review, publish=True)
+
+    def test_access_with_debug(self):
+        """Testing PreviewReviewEmailView access with DEBUG=True"""
+        self._test_access(debug=True, expected_status=200)
 
     def test_access_without_debug(self):
         """Testing PreviewReviewEmailView access with DEBUG=False"""
-        review_request = self.create_review_request(publish=True)
-        review = self.create_review(review_request, publish=True)
-
-        with self.settings(DEBUG=False):
-            response = self.client.get(
-                local_site_reverse(
-                    'preview-review-email',
-                    kwargs={
-                        'review_request_id': review_request.pk,
-                        'review_id': review.pk,
-                        'message_format': 'text',
-                    }))
-
-        self.assertEqual(response.status_code, 404)
+        self._test_access(debug=False, expected_status=404)
 
     def test_reply_access_with_debug(self):
         """Testing PreviewReviewEmailView with reply access and DEBUG=True"""
-        review_request = self.create_review_request(publish=True)
-        review = self.create_review(review_request, publish=True)
-        reply = self.create_reply(review, publish=True)
-
-        with self.settings(DEBUG=True):
-            response = self.client.get(
-                local_site_reverse(
-                    'preview-review-reply-email',
-                    kwargs={
-                        'review_request_id': review_request.pk,
-                        'review_id': review.pk,
-                        'reply_id': reply.pk,
-                        'message_format': 'text',
-                    }))
-
-        self.assertEqual(response.status_code, 200)
+        self._test_access(debug=True, expected_status=200, reply=True)
 
     def test_reply_access_without_debug(self):
         """Testing PreviewReviewEmailView with reply access and DEBUG=False"""
-        review_request = self.create_review_request(publish=True)
-        review = self.create_review(review_request, publish=True)
-        reply = self.create_reply(review, publish=True)
-
-        with self.settings(DEBUG=False):
-            response = self.client.get(
-                local_site_reverse(
-                    'preview-review-reply-email',
-                    kwargs={
-                        'review_request_id': review_request.pk,
-                        'review_id': review.pk,
-                        'reply_id': reply.pk,
-                        'message_format': 'text',
-                    }))
-
-        self.assertEqual(response.status_code, 404)
+        self._test_access(debug=False, expected_status=404, reply=True)
+
+    def _test_access(self, debug, expected_status, reply=False):
+        """Test access to a review or reply e-mail preview.
+
+        Args:
+            debug (bool):
+                The value for ``settings.DEBUG`` during the request.
+
+            expected_status (int):
+                The expected HTTP status code.
+
+            reply (bool, optional):
+                Whether to preview the e-mail for the reply, instead of the
+                review.
+        """
+        kwargs = {
+            'review_request_id': self.review_request.pk,
+            'review_id': self.review.pk,
+            'message_format': 'text',
+        }
+
+        if reply:
+            url_name = 'preview-review-reply-email'
+            kwargs['reply_id'] = self.reply.pk
+        else:
+            url_name = 'preview-review-email'
+
+        with self.settings(DEBUG=debug):
+            response = self.client.get(local_site_reverse(url_name,
+                                                          kwargs=kwargs))
+
+        self.assertEqual(response.status_code, expected_status)
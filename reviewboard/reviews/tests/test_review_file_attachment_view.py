@@ -2,6 +2,10 @@
 
 from __future__ import unicode_literals
 
+import copy
+
+from reviewboard.attachments.models import FileAttachment
+from reviewboard.reviews.models import ReviewRequest
 from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.testing import TestCase
 
@@ -10,13 +14,50 @@ class ReviewFileAttachmentViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.ReviewFileAttachmentView."""
 
     fixtures = ['test_users']
+    load_fixtures_once = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ReviewFileAttachmentViewTests, cls).setUpTestData()
+
+        helper = cls.get_data_helper()
+
+        cls.review_request = helper.create_review_request(publish=True)
+        cls.attachment = helper.create_file_attachment(cls.review_request)
+        cls.diff_against_attachment = \
+            helper.create_file_attachment(cls.review_request)
+        cls.inactive_attachment = helper.create_file_attachment(
+            cls.review_request,
+            active=False)
+        cls.draft_attachment = helper.create_file_attachment(
+            cls.review_request,
+            draft=True)
+        cls.inactive_draft_attachment = helper.create_file_attachment(
+            cls.review_request,
+            draft=True,
+            active=False)
+
+        cls.review_request2 = helper.create_review_request(publish=True)
+        cls.other_attachment = \
+            cls._create_bare_file_attachment(cls.review_request2)
+        cls.other_draft_attachment = helper.create_file_attachment(
+            cls.review_request2,
+            draft=True)
+
+    def setUp(self):
+        super(ReviewFileAttachmentViewTests, self).setUp()
+
+        # force_login() sets last_login and the auth backend on the user it
+        # is given, so log in with a copy rather than the instance shared by
+        # every test in the class.
+        self.submitter = copy.copy(self.review_request.submitter)
 
     def test_access_with_valid_id(self):
         """Testing ReviewFileAttachmentView access with valid attachment for
         review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
+        review_request = self.review_request
+        attachment = self.attachment
 
         response = self.client.get(
             local_site_reverse(
@@ -31,12 +72,11 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with valid attachment for
         review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, draft=True)
+        review_request = self.review_request
+        attachment = self.draft_attachment
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -51,10 +91,8 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid attachment for
         review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
-
-        review_request2 = self.create_review_request(publish=True)
+        attachment = self.attachment
+        review_request2 = self.review_request2
 
         response = self.client.get(
             local_site_reverse(
@@ -69,14 +107,11 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid attachment for
         review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, draft=True)
-
-        review_request2 = self.create_review_request(publish=True)
+        attachment = self.draft_attachment
+        review_request2 = self.review_request2
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -91,8 +126,8 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with valid inactive
         attachment for review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, active=False)
+        review_request = self.review_request
+        attachment = self.inactive_attachment
 
         response = self.client.get(
             local_site_reverse(
@@ -107,13 +142,11 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with valid inactive
         attachment for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, draft=True,
-                                                 active=False)
+        review_request = self.review_request
+        attachment = self.inactive_draft_attachment
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -128,10 +161,8 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid inactive
         attachment for review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, active=False)
-
-        review_request2 = self.create_review_request(publish=True)
+        attachment = self.inactive_attachment
+        review_request2 = self.review_request2
 
         response = self.client.get(
             local_site_reverse(
@@ -146,15 +177,11 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid inactive
         attachment for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request, draft=True,
-                                                 active=False)
-
-        review_request2 = self.create_review_request(publish=True)
+        attachment = self.inactive_draft_attachment
+        review_request2 = self.review_request2
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -169,9 +196,9 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with valid diff-against
         attachment for review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
-        attachment2 = self.create_file_attachment(review_request)
+        review_request = self.review_request
+        attachment = self.attachment
+        attachment2 = self.diff_against_attachment
 
         response = self.client.get(
             local_site_reverse(
@@ -187,13 +214,12 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with valid diff-against
         attachment for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
-        attachment2 = self.create_file_attachment(review_request, draft=True)
+        review_request = self.review_request
+        attachment = self.attachment
+        attachment2 = self.draft_attachment
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -209,11 +235,9 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid diff-against
         attachment for review request
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
-
-        review_request2 = self.create_review_request(publish=True)
-        attachment2 = self.create_file_attachment(review_request2)
+        review_request = self.review_request
+        attachment = self.attachment
+        attachment2 = self.other_attachment
 
         response = self.client.get(
             local_site_reverse(
@@ -229,15 +253,12 @@ class ReviewFileAttachmentViewTests(TestCase):
         """Testing ReviewFileAttachmentView access with invalid diff-against
         attachment for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        attachment = self.create_file_attachment(review_request)
-
-        review_request2 = self.create_review_request(publish=True)
-        attachment2 = self.create_file_attachment(review_request2, draft=True)
+        review_request = self.review_request
+        attachment = self.attachment
+        attachment2 = self.other_draft_attachment
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -248,3 +269,36 @@ class ReviewFileAttachmentViewTests(TestCase):
                     'file_attachment_diff_id': attachment2.pk,
                 }))
         self.assertEqual(response.status_code, 404)
+
+    @classmethod
+    def _create_bare_file_attachment(cls, review_request):
+        """Create a file attachment row with no stored file.
+
+        This is cheaper than :py:meth:`create_file_attachment`, which writes
+        the file to storage and goes through the many-to-many relation
+        manager. It's meant for tests that only need an attachment ID that
+        the view will reject, and must not be used where the attachment is
+        rendered or where the review request's attachment counts matter.
+
+        Args:
+            review_request (reviewboard.reviews.models.review_request.
+                            ReviewRequest):
+                The review request that will own the file attachment.
+
+        Returns:
+            reviewboard.attachments.models.FileAttachment:
+            The new file attachment.
+        """
+        file_attachment = FileAttachment.objects.create(
+            caption='My Caption',
+            orig_filename='logo.png',
+            mimetype='image/png',
+            uuid='test-uuid')
+
+        ReviewRequest.file_attachments.through.objects.bulk_create([
+            ReviewRequest.file_attachments.through(
+                reviewrequest_id=review_request.pk,
+                fileattachment_id=file_attachment.pk),
+        ])
+
+        return file_attachment
@@ -2,6 +2,7 @@
 
 from __future__ import unicode_literals
 
+import copy
 from datetime import timedelta
 
 from django.contrib.auth.models import User
@@ -9,13 +10,17 @@ from django.test.html import parse_html
 from django.utils import six
 from djblets.extensions.hooks import TemplateHook
 from djblets.extensions.models import RegisteredExtension
-from djblets.siteconfig.models import SiteConfiguration
 from kgb import SpyAgency
 
 from reviewboard.extensions.base import Extension, get_extension_manager
+from reviewboard.notifications.email.signal_handlers import \
+    send_review_published_mail
+from reviewboard.notifications.webhooks import review_published_cb
 from reviewboard.reviews.detail import InitialStatusUpdatesEntry, ReviewEntry
 from reviewboard.reviews.fields import get_review_request_fieldsets
-from reviewboard.reviews.models import Comment, GeneralComment, Review
+from reviewboard.reviews.models import (Comment, GeneralComment, Review,
+                                        ReviewRequest)
+from reviewboard.reviews.views import ReviewRequestDetailView
 from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.testing import TestCase
 
@@ -24,12 +29,47 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
     """Unit tests for reviewboard.reviews.views.ReviewRequestDetailView."""
 
     fixtures = ['test_users', 'test_scmtools', 'test_site']
+    load_fixtures_once = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ReviewRequestDetailViewTests, cls).setUpTestData()
+
+        cls.fixture_users = {
+            user.username: user
+            for user in User.objects.filter(username__in=('doc', 'dopey'))
+        }
+
+        # A published review request with a repository, which tests can
+        # build diffs and reviews on. Tests should fetch their own copy
+        # through _get_shared_review_request().
+        cls.shared_review_request_id = \
+            cls.get_data_helper().create_review_request(
+                create_repository=True,
+                publish=True).pk
+
+        # Reverse the review request page URL once, turning it into a format
+        # string that tests can fill in with a review request ID.
+        cls.detail_url_format = cls.get_url_format('review-request-detail',
+                                                   ['review_request_id'])
+
+    def setUp(self):
+        super(ReviewRequestDetailViewTests, self).setUp()
+
+        # Give each test its own copies of the users, so that state cached
+        # on them during a test (such as profiles) doesn't outlive the
+        # test's transaction.
+        self.users = {
+            username: copy.copy(user)
+            for username, user in six.iteritems(self.fixture_users)
+        }
 
     def test_get(self):
         """Testing ReviewRequestDetailView.get"""
         review_request = self.create_review_request(publish=True)
 
-        response = self.client.get('/r/%d/' % review_request.id)
+        response = self.client.get(
+            self.detail_url_format % review_request.display_id)
         self.assertEqual(response.status_code, 200)
 
         self.assertEqual(response.context['review_request'].pk,
@@ -53,7 +93,8 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
             description=description,
             testing_done=testing_done)
 
-        response = self.client.get('/r/%s/' % review_request.pk)
+        response = self.client.get(
+            self.detail_url_format % review_request.display_id)
         self.assertEqual(response.status_code, 200)
 
         review_request = response.context['review_request']
@@ -71,14 +112,13 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         comment_text_2 = 'Comment text 2'
         comment_text_3 = 'Comment text 3'
 
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self._get_shared_review_request()
         diffset = self.create_diffset(review_request)
         filediff = self.create_filediff(diffset)
 
         # Create the users who will be commenting.
-        user1 = User.objects.get(username='doc')
-        user2 = User.objects.get(username='dopey')
+        user1 = self.users['doc']
+        user2 = self.users['dopey']
 
         # Create the master review.
         main_review = self.create_review(review_request, user=user1)
@@ -110,18 +150,18 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         self.assertTrue(reply1.timestamp > reply2.timestamp)
 
         # Make sure they're looked up in the order expected.
-        comments = list(
-            Comment.objects
-            .filter(review__review_request=review_request)
-            .order_by('timestamp')
-        )
-        self.assertEqual(len(comments), 3)
-        self.assertEqual(comments[0].text, comment_text_1)
-        self.assertEqual(comments[1].text, comment_text_3)
-        self.assertEqual(comments[2].text, comment_text_2)
+        self.assertEqual(
+            list(
+                Comment.objects
+                .filter(review__review_request=review_request)
+                .order_by('timestamp')
+                .values_list('text', flat=True)
+            ),
+            [comment_text_1, comment_text_3, comment_text_2])
 
         # Now figure out the order on the page.
-        response = self.client.get('/r/%d/' % review_request.pk)
+        response = self.client.get(
+            self.detail_url_format % review_request.display_id)
         self.assertEqual(response.status_code, 200)
 
         entries = response.context['entries']
@@ -149,11 +189,10 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         comment_text_1 = 'Comment text 1'
         comment_text_2 = 'Comment text 2'
         comment_text_3 = 'Comment text 3'
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self._get_shared_review_request()
         # Create the users who will be commenting.
-        user1 = User.objects.get(username='doc')
-        user2 = User.objects.get(username='dopey')
+        user1 = self.users['doc']
+        user2 = self.users['dopey']
 
         # Create the master review.
         main_review = self.create_review(review_request, user=user1)
@@ -185,15 +224,14 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         self.assertTrue(reply1.timestamp > reply2.timestamp)
 
         # Make sure they're looked up in the order expected.
-        comments = list(
-            GeneralComment.objects
-            .filter(review__review_request=review_request)
-            .order_by('timestamp')
-        )
-        self.assertEqual(len(comments), 3)
-        self.assertEqual(comments[0].text, comment_text_1)
-        self.assertEqual(comments[1].text, comment_text_3)
-        self.assertEqual(comments[2].text, comment_text_2)
+        self.assertEqual(
+            list(
+                GeneralComment.objects
+                .filter(review__review_request=review_request)
+                .order_by('timestamp')
+                .values_list('text', flat=True)
+            ),
+            [comment_text_1, comment_text_3, comment_text_2])
 
     def test_file_attachments_visibility(self):
         """Testing ReviewRequestDetailView default visibility of file
@@ -205,7 +243,7 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         comment_text_1 = 'Comment text 1'
         comment_text_2 = 'Comment text 2'
 
-        user1 = User.objects.get(username='doc')
+        user1 = self.users['doc']
         review_request = self.create_review_request()
 
         # Add two file attachments. One active, one inactive.
@@ -218,7 +256,9 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         self.create_file_attachment(review_request, caption=caption_3,
                                     draft=True)
 
-        # Create the review with comments for each screenshot.
+        self._mute_review_published_handlers()
+
+        # Create the review with comments for each file attachment.
         review = Review.objects.create(review_request=review_request,
                                        user=user1)
         review.file_attachment_comments.create(file_attachment=file1,
@@ -228,18 +268,16 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         review.publish()
 
         # Check that we can find all the objects we expect on the page.
-        self.client.login(username='doc', password='doc')
-        response = self.client.get('/r/%d/' % review_request.pk)
-        self.assertEqual(response.status_code, 200)
+        context = self._get_context(review_request, user=user1)
 
-        file_attachments = response.context['file_attachments']
+        file_attachments = context['file_attachments']
         self.assertEqual(len(file_attachments), 2)
         self.assertEqual(file_attachments[0].caption, caption_1)
         self.assertEqual(file_attachments[1].caption, caption_3)
 
         # Make sure that other users won't see the draft one.
-        self.client.logout()
-        response = self.client.get('/r/%d/' % review_request.pk)
+        response = self.client.get(
+            self.detail_url_format % review_request.display_id)
         self.assertEqual(response.status_code, 200)
 
         file_attachments = response.context['file_attachments']
@@ -270,7 +308,7 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         comment_text_1 = 'Comment text 1'
         comment_text_2 = 'Comment text 2'
 
-        user1 = User.objects.get(username='doc')
+        user1 = self.users['doc']
         review_request = self.create_review_request()
 
         # Add two screenshots. One active, one inactive.
@@ -282,8 +320,9 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         # Add a third screenshot on a draft.
         self.create_screenshot(review_request, caption=caption_3, draft=True)
 
+        self._mute_review_published_handlers()
+
         # Create the review with comments for each screenshot.
-        user1 = User.objects.get(username='doc')
         review = Review.objects.create(review_request=review_request,
                                        user=user1)
         review.screenshot_comments.create(screenshot=screenshot1,
@@ -301,18 +340,16 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         review.publish()
 
         # Check that we can find all the objects we expect on the page.
-        self.client.login(username='doc', password='doc')
-        response = self.client.get('/r/%d/' % review_request.pk)
-        self.assertEqual(response.status_code, 200)
+        context = self._get_context(review_request, user=user1)
 
-        screenshots = response.context['screenshots']
+        screenshots = context['screenshots']
         self.assertEqual(len(screenshots), 2)
         self.assertEqual(screenshots[0].caption, caption_1)
         self.assertEqual(screenshots[1].caption, caption_3)
 
         # Make sure that other users won't see the draft one.
-        self.client.logout()
-        response = self.client.get('/r/%d/' % review_request.pk)
+        response = self.client.get(
+            self.detail_url_format % review_request.display_id)
         self.assertEqual(response.status_code, 200)
 
         screenshots = response.context['screenshots']
@@ -341,20 +378,18 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         """
         with self.siteconfig_settings({'auth_require_sitewide_login': True},
                                       reload_settings=False):
-            self.create_review_request(publish=True)
+            review_request = self.create_review_request(publish=True)
 
-            response = self.client.get('/r/1/')
+            response = self.client.get(
+                self.detail_url_format % review_request.display_id)
             self.assertEqual(response.status_code, 302)
 
     def test_etag_with_issues(self):
         """Testing ReviewRequestDetailView ETags with issue status toggling"""
-        self.client.login(username='doc', password='doc')
-
         # Some objects we need.
-        user = User.objects.get(username='doc')
+        user = self.users['doc']
 
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self._get_shared_review_request()
         diffset = self.create_diffset(review_request)
         filediff = self.create_filediff(diffset)
 
@@ -365,9 +400,7 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         review.publish()
 
         # Get the etag
-        response = self.client.get(review_request.get_absolute_url())
-        self.assertEqual(response.status_code, 200)
-        etag1 = response['ETag']
+        etag1 = self._get_etag(review_request, user=user)
         self.assertNotEqual(etag1, '')
 
         # Change the issue status
@@ -375,9 +408,7 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
         comment.save()
 
         # Check the etag again
-        response = self.client.get(review_request.get_absolute_url())
-        self.assertEqual(response.status_code, 200)
-        etag2 = response['ETag']
+        etag2 = self._get_etag(review_request, user=user)
         self.assertNotEqual(etag2, '')
 
         # Make sure they're not equal
@@ -459,3 +490,85 @@ class ReviewRequestDetailViewTests(SpyAgency, TestCase):
             '</div>[after-review-request-extra-panes here]\n'
             '</div>',
             parsed_html)
+
+    def _get_shared_review_request(self):
+        """Return the review request shared by tests in this class.
+
+        Returns:
+            reviewboard.reviews.models.review_request.ReviewRequest:
+            A fresh copy of the published review request created in
+            :py:meth:`setUpTestData`.
+        """
+        return ReviewRequest.objects.get(pk=self.shared_review_request_id)
+
+    def _mute_review_published_handlers(self):
+        """Stop e-mail and WebHook handlers from running on review publish.
+
+        This should only be used by tests that don't depend on any side
+        effects of those handlers. The handlers are restored when the test
+        finishes.
+        """
+        self.spy_on(send_review_published_mail, call_original=False)
+        self.spy_on(review_published_cb, call_original=False)
+
+    def _get_etag(self, review_request, user=None):
+        """Return the ETag data for a review request page.
+
+        This computes the ETag the same way the view does when handling a
+        request, but without rendering the page.
+
+        Args:
+            review_request (reviewboard.reviews.models.review_request.
+                            ReviewRequest):
+                The review request to compute the ETag for. This will be
+                re-fetched, so that the ETag reflects the latest state in
+                the database.
+
+            user (django.contrib.auth.models.User, optional):
+                The user viewing the page. If not provided, the ETag will be
+                computed for an anonymous user.
+
+        Returns:
+            unicode:
+            The ETag data for the page.
+        """
+        view = ReviewRequestDetailView()
+        view.request = self.create_http_request(
+            path=review_request.get_absolute_url(),
+            user=user)
+        view.review_request = view.get_review_request(
+            review_request_id=review_request.display_id)
+
+        return view.get_etag_data(view.request)
+
+    def _get_context(self, review_request, user=None):
+        """Return the template context for a review request page.
+
+        This invokes the view directly and returns the context for the
+        response, without going through middleware or rendering the page.
+        It's much cheaper than a full request through the test client, and
+        should be used when a test only needs to inspect the context.
+
+        Args:
+            review_request (reviewboard.reviews.models.review_request.
+                            ReviewRequest):
+                The review request to load the page for.
+
+            user (django.contrib.auth.models.User, optional):
+                The user viewing the page. If not provided, the page will
+                be loaded anonymously.
+
+        Returns:
+            dict:
+            The context for the page.
+        """
+        request = self.create_http_request(
+            path=review_request.get_absolute_url(),
+            user=user)
+
+        response = ReviewRequestDetailView.as_view()(
+            request,
+            review_request_id=review_request.display_id)
+        self.assertEqual(response.status_code, 200)
+
+        return response.context_data
@@ -14,6 +14,10 @@ from reviewboard.reviews.views import ReviewRequestUpdatesView
 from reviewboard.testing import TestCase
 
 
+#: The length prefix before each block of metadata or HTML in the payload.
+_LENGTH_FIELD = struct.Struct(b'<L')
+
+
 class ReviewRequestUpdatesViewTests(TestCase):
     """Unit tests for ReviewRequestUpdatesView."""
 
@@ -364,16 +368,16 @@ class ReviewRequestUpdatesViewTests(TestCase):
 
         while i < len(content):
             # Read the length of the metadata.
-            metadata_len = struct.unpack_from('<L', content, i)[0]
-            i += 4
+            metadata_len = _LENGTH_FIELD.unpack_from(content, i)[0]
+            i += _LENGTH_FIELD.size
 
             # Read the metadata.
             metadata = json.loads(content[i:i + metadata_len].decode('utf-8'))
             i += metadata_len
 
             # Read the length of the HTML.
-            html_len = struct.unpack_from('<L', content, i)[0]
-            i += 4
+            html_len = _LENGTH_FIELD.unpack_from(content, i)[0]
+            i += _LENGTH_FIELD.size
 
             # Read the HTML.
             html = content[i:i + html_len].decode('utf-8')
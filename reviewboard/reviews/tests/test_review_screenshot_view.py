@@ -2,6 +2,8 @@
 
 from __future__ import unicode_literals
 
+import copy
+
 from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.testing import TestCase
 
@@ -10,13 +12,43 @@ class ReviewScreenshotViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.ReviewScreenshotView."""
 
     fixtures = ['test_users']
+    load_fixtures_once = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ReviewScreenshotViewTests, cls).setUpTestData()
+
+        helper = cls.get_data_helper()
+
+        cls.review_request = helper.create_review_request(publish=True)
+        cls.screenshot = helper.create_screenshot(cls.review_request)
+        cls.inactive_screenshot = helper.create_screenshot(
+            cls.review_request,
+            active=False)
+        cls.draft_screenshot = helper.create_screenshot(
+            cls.review_request,
+            draft=True)
+        cls.inactive_draft_screenshot = helper.create_screenshot(
+            cls.review_request,
+            draft=True,
+            active=False)
+
+        cls.review_request2 = helper.create_review_request(publish=True)
+
+    def setUp(self):
+        super(ReviewScreenshotViewTests, self).setUp()
+
+        # force_login() sets last_login and the auth backend on the user it
+        # is given, so log in with a copy rather than the instance shared by
+        # every test in the class.
+        self.submitter = copy.copy(self.review_request.submitter)
 
     def test_access_with_valid_id(self):
         """Testing ReviewScreenshotView access with valid screenshot for review
         request
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request)
+        review_request = self.review_request
+        screenshot = self.screenshot
 
         response = self.client.get(
             local_site_reverse(
@@ -31,12 +63,11 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with valid screenshot for review
         request draft
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, draft=True)
+        review_request = self.review_request
+        screenshot = self.draft_screenshot
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -51,8 +82,8 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with valid inactive screenshot
         for review request
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, active=False)
+        review_request = self.review_request
+        screenshot = self.inactive_screenshot
 
         response = self.client.get(
             local_site_reverse(
@@ -67,13 +98,11 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with valid inactive screenshot
         for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, draft=True,
-                                            active=False)
+        review_request = self.review_request
+        screenshot = self.inactive_draft_screenshot
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -88,10 +117,8 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with invalid screenshot for
         review request
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request)
-
-        review_request2 = self.create_review_request(publish=True)
+        screenshot = self.screenshot
+        review_request2 = self.review_request2
 
         response = self.client.get(
             local_site_reverse(
@@ -106,14 +133,11 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with invalid screenshot for
         review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, draft=True)
-
-        review_request2 = self.create_review_request(publish=True)
+        screenshot = self.draft_screenshot
+        review_request2 = self.review_request2
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
@@ -128,10 +152,8 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with invalid inactive screenshot
         for review request
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, active=False)
-
-        review_request2 = self.create_review_request(publish=True)
+        screenshot = self.inactive_screenshot
+        review_request2 = self.review_request2
 
         response = self.client.get(
             local_site_reverse(
@@ -146,15 +168,11 @@ class ReviewScreenshotViewTests(TestCase):
         """Testing ReviewScreenshotView access with invalid inactive screenshot
         for review request draft
         """
-        review_request = self.create_review_request(publish=True)
-        screenshot = self.create_screenshot(review_request, draft=True,
-                                            active=False)
-
-        review_request2 = self.create_review_request(publish=True)
+        screenshot = self.inactive_draft_screenshot
+        review_request2 = self.review_request2
 
         # Log in so that we can check against the draft.
-        username = review_request.submitter.username
-        self.client.login(username=username, password=username)
+        self.client.force_login(self.submitter)
 
         response = self.client.get(
             local_site_reverse(
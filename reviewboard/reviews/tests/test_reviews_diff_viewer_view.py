@@ -2,20 +2,106 @@
 
 from __future__ import unicode_literals
 
+from reviewboard.reviews.models import ReviewRequest
 from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.testing import TestCase
 
 
+def _mkdiff(path, src_index, dst_index, hunks):
+    """Return a Git diff for a single file.
+
+    Args:
+        path (bytes):
+            The path of the file being modified.
+
+        src_index (bytes):
+            The abbreviated blob SHA of the original file, or ``None`` if the
+            file is being created.
+
+        dst_index (bytes):
+            The abbreviated blob SHA of the modified file.
+
+        hunks (bytes):
+            The hunks of the diff, starting with the first ``@@`` line.
+
+    Returns:
+        bytes:
+        The resulting diff.
+    """
+    if src_index is None:
+        header = (
+            b'new file mode 100644\n'
+            b'index 0000000..%s\n'
+            b'--- /dev/null\n'
+            % dst_index)
+    else:
+        header = (
+            b'index %s..%s 100644\n'
+            b'--- a/%s\n'
+            % (src_index, dst_index, path))
+
+    return (b'diff --git a/%s b/%s\n' % (path, path) +
+            header +
+            b'+++ b/%s\n' % path +
+            hunks)
+
+
 class ReviewsDiffViewerViewTests(TestCase):
     """Unit tests for reviewboard.reviews.views.ReviewsDiffViewerView."""
 
     fixtures = ['test_users', 'test_scmtools']
+    load_fixtures_once = True
+
+    DIFFUTILS_DIFF = _mkdiff(
+        b'diffutils.py', b'6bba278', b'465d217',
+        b'@@ -1,3 +1,4 @@\n'
+        b'+# diffutils.py\n'
+        b' import fnmatch\n'
+        b' import os\n'
+        b' import re\n')
+
+    README_DIFF_1 = _mkdiff(
+        b'readme', b'd6613f5', b'5b50866',
+        b'@@ -1 +1,3 @@\n'
+        b' Hello there\n'
+        b'+\n'
+        b'+Oh hi!\n')
+
+    README_DIFF_2 = _mkdiff(
+        b'readme', b'd6613f5', b'5b50867',
+        b'@@ -1 +1,3 @@\n'
+        b' Hello there\n'
+        b'+----------\n'
+        b'+Oh hi!\n')
+
+    NEW_FILE_DIFF_1 = _mkdiff(
+        b'new_file', None, b'ac30bd3',
+        b'@@ -0,0 +1 @@\n'
+        b'+This is a new file!\n')
+
+    NEW_FILE_DIFF_2 = _mkdiff(
+        b'new_file', None, b'ac30bd4',
+        b'@@ -0,0 +1 @@\n'
+        b'+This is a diffent version of this new file!\n')
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ReviewsDiffViewerViewTests, cls).setUpTestData()
+
+        cls.review_request_id = cls.get_data_helper().create_review_request(
+            create_repository=True,
+            publish=True).pk
+
+    def setUp(self):
+        super(ReviewsDiffViewerViewTests, self).setUp()
+
+        self.review_request = \
+            ReviewRequest.objects.get(pk=self.review_request_id)
 
     # Bug 892
     def test_interdiff(self):
         """Testing ReviewsDiffViewerView with interdiffs"""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
         diffset = self.create_diffset(review_request, revision=1)
         self.create_filediff(
             diffset,
@@ -23,48 +109,21 @@ class ReviewsDiffViewerViewTests(TestCase):
             dest_file='/diffutils.py',
             source_revision='6bba278',
             dest_detail='465d217',
-            diff=(
-                b'diff --git a/diffutils.py b/diffutils.py\n'
-                b'index 6bba278..465d217 100644\n'
-                b'--- a/diffutils.py\n'
-                b'+++ b/diffutils.py\n'
-                b'@@ -1,3 +1,4 @@\n'
-                b'+# diffutils.py\n'
-                b' import fnmatch\n'
-                b' import os\n'
-                b' import re\n'
-            ))
+            diff=self.DIFFUTILS_DIFF)
         self.create_filediff(
             diffset,
             source_file='/readme',
             dest_file='/readme',
             source_revision='d6613f5',
             dest_detail='5b50866',
-            diff=(
-                b'diff --git a/readme b/readme\n'
-                b'index d6613f5..5b50866 100644\n'
-                b'--- a/readme\n'
-                b'+++ b/readme\n'
-                b'@@ -1 +1,3 @@\n'
-                b' Hello there\n'
-                b'+\n'
-                b'+Oh hi!\n'
-            ))
+            diff=self.README_DIFF_1)
         self.create_filediff(
             diffset,
             source_file='/newfile',
             dest_file='/newfile',
             source_revision='PRE-CREATION',
             dest_detail='',
-            diff=(
-                b'diff --git a/new_file b/new_file\n'
-                b'new file mode 100644\n'
-                b'index 0000000..ac30bd3\n'
-                b'--- /dev/null\n'
-                b'+++ b/new_file\n'
-                b'@@ -0,0 +1 @@\n'
-                b'+This is a new file!\n'
-            ))
+            diff=self.NEW_FILE_DIFF_1)
 
         diffset = self.create_diffset(review_request, revision=2)
         self.create_filediff(
@@ -73,50 +132,24 @@ class ReviewsDiffViewerViewTests(TestCase):
             dest_file='/diffutils.py',
             source_revision='6bba278',
             dest_detail='465d217',
-            diff=(
-                b'diff --git a/diffutils.py b/diffutils.py\n'
-                b'index 6bba278..465d217 100644\n'
-                b'--- a/diffutils.py\n'
-                b'+++ b/diffutils.py\n'
-                b'@@ -1,3 +1,4 @@\n'
-                b'+# diffutils.py\n'
-                b' import fnmatch\n'
-                b' import os\n'
-                b' import re\n'
-            ))
+            diff=self.DIFFUTILS_DIFF)
         self.create_filediff(
             diffset,
             source_file='/readme',
             dest_file='/readme',
             source_revision='d6613f5',
             dest_detail='5b50867',
-            diff=(
-                b'diff --git a/readme b/readme\n'
-                b'index d6613f5..5b50867 100644\n'
-                b'--- a/readme\n'
-                b'+++ b/readme\n'
-                b'@@ -1 +1,3 @@\n'
-                b' Hello there\n'
-                b'+----------\n'
-                b'+Oh hi!\n'
-            ))
+            diff=self.README_DIFF_2)
         self.create_filediff(
             diffset,
             source_file='/newfile',
             dest_file='/newfile',
             source_revision='PRE-CREATION',
             dest_detail='',
-            diff=(
-                b'diff --git a/new_file b/new_file\n'
-                b'new file mode 100644\n'
-                b'index 0000000..ac30bd4\n'
-                b'--- /dev/null\n'
-                b'+++ b/new_file\n'
-                b'@@ -0,0 +1 @@\n'
-                b'+This is a diffent version of this new file!\n'
-            ))
-
-        response = self.client.get('/r/1/diff/1-2/')
+            diff=self.NEW_FILE_DIFF_2)
+
+        response = self.client.get(
+            '/r/%d/diff/1-2/' % review_request.display_id)
 
         # Useful for debugging any actual errors here.
         if response.status_code != 200:
@@ -140,8 +173,7 @@ class ReviewsDiffViewerViewTests(TestCase):
     # Bug 847
     def test_interdiff_new_file(self):
         """Testing ReviewsDiffViewrView with interdiffs containing new files"""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
         diffset = self.create_diffset(review_request, revision=1)
         self.create_filediff(
             diffset,
@@ -149,17 +181,7 @@ class ReviewsDiffViewerViewTests(TestCase):
             dest_file='/diffutils.py',
             source_revision='6bba278',
             dest_detail='465d217',
-            diff=(
-                b'diff --git a/diffutils.py b/diffutils.py\n'
-                b'index 6bba278..465d217 100644\n'
-                b'--- a/diffutils.py\n'
-                b'+++ b/diffutils.py\n'
-                b'@@ -1,3 +1,4 @@\n'
-                b'+# diffutils.py\n'
-                b' import fnmatch\n'
-                b' import os\n'
-                b' import re\n'
-            ))
+            diff=self.DIFFUTILS_DIFF)
 
         diffset = self.create_diffset(review_request, revision=2)
         self.create_filediff(
@@ -168,34 +190,17 @@ class ReviewsDiffViewerViewTests(TestCase):
             dest_file='/diffutils.py',
             source_revision='6bba278',
             dest_detail='465d217',
-            diff=(
-                b'diff --git a/diffutils.py b/diffutils.py\n'
-                b'index 6bba278..465d217 100644\n'
-                b'--- a/diffutils.py\n'
-                b'+++ b/diffutils.py\n'
-                b'@@ -1,3 +1,4 @@\n'
-                b'+# diffutils.py\n'
-                b' import fnmatch\n'
-                b' import os\n'
-                b' import re\n'
-            ))
+            diff=self.DIFFUTILS_DIFF)
         self.create_filediff(
             diffset,
             source_file='/newfile',
             dest_file='/newfile',
             source_revision='PRE-CREATION',
             dest_detail='',
-            diff=(
-                b'diff --git a/new_file b/new_file\n'
-                b'new file mode 100644\n'
-                b'index 0000000..ac30bd4\n'
-                b'--- /dev/null\n'
-                b'+++ b/new_file\n'
-                b'@@ -0,0 +1 @@\n'
-                b'+This is a diffent version of this new file!\n'
-            ))
-
-        response = self.client.get('/r/1/diff/1-2/')
+            diff=self.NEW_FILE_DIFF_2)
+
+        response = self.client.get(
+            '/r/%d/diff/1-2/' % review_request.display_id)
 
         # Useful for debugging any actual errors here.
         if response.status_code != 200:
@@ -215,8 +220,7 @@ class ReviewsDiffViewerViewTests(TestCase):
 
     def test_with_filenames_option(self):
         """Testing ReviewsDiffViewerView with ?filenames=..."""
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
         diffset = self.create_diffset(review_request)
         filediff1 = self.create_filediff(diffset,
                                          source_file='src/main/test.c',
@@ -253,8 +257,7 @@ class ReviewsDiffViewerViewTests(TestCase):
     def test_with_filenames_option_normalized(self):
         """Testing ReviewsDiffViewerView with ?filenames=... values normalized
         """
-        review_request = self.create_review_request(create_repository=True,
-                                                    publish=True)
+        review_request = self.review_request
         diffset = self.create_diffset(review_request)
         filediff1 = self.create_filediff(diffset,
                                          source_file='src/main/test.c',
@@ -21,14 +21,16 @@ class RootViewTests(TestCase):
                                       reload_settings=False):
             response = self.client.get(local_site_reverse('root'))
 
-        self.assertRedirects(response, '/account/login/?next=/')
+        self.assertRedirects(response, '/account/login/?next=/',
+                             fetch_redirect_response=False)
 
     def test_with_anonymous_with_public_access(self):
         """Testing RootView with anonymous user with anonymous access allowed
         """
         response = self.client.get(local_site_reverse('root'))
 
-        self.assertRedirects(response, '/r/')
+        self.assertRedirects(response, '/r/',
+                             fetch_redirect_response=False)
 
     def test_with_logged_in(self):
         """Testing RootView with authenticated user"""
@@ -36,7 +38,8 @@ class RootViewTests(TestCase):
 
         response = self.client.get(local_site_reverse('root'))
 
-        self.assertRedirects(response, '/dashboard/')
+        self.assertRedirects(response, '/dashboard/',
+                             fetch_redirect_response=False)
 
     @add_fixtures(['test_site'])
     def test_with_anonymous_with_local_site_private(self):
@@ -46,7 +49,8 @@ class RootViewTests(TestCase):
 
         self.assertRedirects(response,
                              '/account/login/?next=/s/%s/'
-                             % self.local_site_name)
+                             % self.local_site_name,
+                             fetch_redirect_response=False)
 
     @add_fixtures(['test_site'])
     def test_with_anonymous_with_local_site_public(self):
@@ -58,7 +62,8 @@ class RootViewTests(TestCase):
         response = self.client.get(local_site_reverse('root',
                                                       local_site=local_site))
 
-        self.assertRedirects(response, '/s/%s/r/' % self.local_site_name)
+        self.assertRedirects(response, '/s/%s/r/' % self.local_site_name,
+                             fetch_redirect_response=False)
 
     @add_fixtures(['test_site'])
     def test_with_logged_in_with_local_site(self):
@@ -69,4 +74,5 @@ class RootViewTests(TestCase):
             local_site_reverse('root', local_site_name=self.local_site_name))
 
         self.assertRedirects(response,
-                             '/s/%s/dashboard/' % self.local_site_name)
+                             '/s/%s/dashboard/' % self.local_site_name,
+                             fetch_redirect_response=False)
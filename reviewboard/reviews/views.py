@@ -1487,7 +1487,18 @@ class CommentDiffFragmentsView(ReviewRequestViewMixin, ETagViewMixin,
         else:
             q &= Q(review__public=True)
 
-        self.comments = get_list_or_404(Comment, q)
+        # The FileDiffs and their DiffSets are needed to render each
+        # fragment and to build the comment links, so fetch them along with
+        # the comments.
+        self.comments = get_list_or_404(
+            Comment.objects.select_related('filediff__diffset',
+                                           'interfilediff__diffset'),
+            q)
+
+        # All the comments are on the review request we already have, so
+        # save them from each looking it up through their review.
+        for comment in self.comments:
+            comment._review_request = self.review_request
 
         latest_timestamp = get_latest_timestamp(
             comment.timestamp
@@ -314,6 +314,25 @@ except ImportError as exc:
     dependency_error('Unable to import settings_local.py: %s' % exc)
 
 
+if RUNNING_TEST and os.environ.get(str('RB_FAST_VIEW_TESTS')) == str('1'):
+    # Run the tests against an in-memory SQLite database, regardless of the
+    # database configured in settings_local.py. This avoids the disk and
+    # network overhead of a real database server for test modules that don't
+    # need it, such as the view tests. For example:
+    #
+    #     RB_FAST_VIEW_TESTS=1 ./tests/runtests.py \
+    #         reviewboard/reviews/tests/test_review_request_detail_view.py
+    #
+    # Tests that need a particular database backend won't behave correctly
+    # with this set.
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        },
+    }
+
+
 SESSION_COOKIE_PATH = SITE_ROOT
 
 INSTALLED_APPS = RB_BUILTIN_APPS + RB_EXTRA_APPS + ['django_evolution']
@@ -364,6 +383,27 @@ TEMPLATES = [
     },
 ]
 
+if RUNNING_TEST:
+    # The conditional cached loader doesn't cache templates while DEBUG is
+    # on, which some tests turn on. Always cache compiled templates when
+    # running tests.
+    #
+    # Changing DEBUG or TEMPLATES (for instance, through override_settings())
+    # still rebuilds the template engines, discarding this cache. Templates
+    # stay cached between those overrides, not for the whole test run.
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        (
+            'django.template.loaders.cached.Loader',
+            TEMPLATES[0]['OPTIONS']['loaders'][0][1],
+        ),
+    ]
+
+    # The test runner turns off DEBUG, but the template engine's debug
+    # option has already been set from DEBUG above. Turn it off as well, so
+    # templates render without the extra debug bookkeeping (as they do in
+    # production).
+    TEMPLATES[0]['OPTIONS']['debug'] = False
+
 
 if not LOCAL_ROOT:
     local_dir = os.path.dirname(settings_local.__file__)
@@ -11,6 +11,7 @@ import sys
 
 from django.conf import settings
 from django.contrib import admin
+from django.db import connections
 from djblets.testing.testrunners import TestRunner
 
 
@@ -62,6 +63,27 @@ class RBTestRunner(TestRunner):
             The return result from Django's implementation. This value is
             considered opaque here.
         """
+        # If we're one of several test runners running in parallel (for
+        # instance, when sharding the test suite across CPU cores), give
+        # this runner its own test database. Otherwise, the runners will
+        # fight over creating, populating, and destroying the same one.
+        #
+        # SQLite test databases are in-memory by default, and are therefore
+        # already private to the process.
+        worker_id = os.environ.get(str('RB_TEST_WORKER_ID'))
+
+        if worker_id:
+            for connection in connections.all():
+                settings_dict = connection.settings_dict
+                test_settings = settings_dict.setdefault('TEST', {})
+
+                if (settings_dict['ENGINE'] != 'django.db.backends.sqlite3' or
+                    test_settings.get('NAME')):
+                    test_db_name = (test_settings.get('NAME') or
+                                    'test_%s' % settings_dict['NAME'])
+                    test_settings['NAME'] = '%s_%s' % (test_db_name,
+                                                       worker_id)
+
         result = super(RBTestRunner, self).setup_databases()
 
         # Create an initial SiteConfiguration.
@@ -14,6 +14,7 @@ from django.core.cache import cache
 from django.core.files import File
 from django.core.files.base import ContentFile
 from django.core.urlresolvers import ResolverMatch
+from django.db import DEFAULT_DB_ALIAS
 from django.test.client import RequestFactory
 from django.utils import six, timezone
 from djblets.siteconfig.models import SiteConfiguration
@@ -44,6 +45,7 @@ from reviewboard.reviews.models import (Comment,
                                         StatusUpdate)
 from reviewboard.scmtools.models import Repository, Tool
 from reviewboard.site.models import LocalSite
+from reviewboard.site.urlresolvers import local_site_reverse
 from reviewboard.webapi.models import WebAPIToken
 
 
@@ -69,6 +71,13 @@ class TestCase(FixturesCompilerMixin, DjbletsTestCase):
 
     ws_re = re.compile(r'\s+')
 
+    #: Whether to load the class's fixtures only once for the whole class.
+    #:
+    #: Test classes that create shared data in :py:meth:`setUpTestData`
+    #: referencing fixture data should set this. Otherwise, reloading the
+    #: fixtures before each test would delete that data.
+    load_fixtures_once = False
+
     DEFAULT_FILEDIFF_DATA_DIFF = (
         b'--- README\trevision 123\n'
         b'+++ README\trevision 123\n'
@@ -129,6 +138,14 @@ class TestCase(FixturesCompilerMixin, DjbletsTestCase):
         b'Binary files a/logo.png and b/logo.png differ\n'
     )
 
+    @classmethod
+    def setUpClass(cls):
+        # Django will call setUpTestData() while setting up the class, so
+        # make sure Review Board is ready before any test data is created.
+        initialize(load_extensions=False)
+
+        super(TestCase, cls).setUpClass()
+
     def setUp(self):
         super(TestCase, self).setUp()
 
@@ -154,6 +171,107 @@ class TestCase(FixturesCompilerMixin, DjbletsTestCase):
 
         return doc
 
+    @classmethod
+    def get_data_helper(cls):
+        """Return an instance of the class for creating class-level data.
+
+        The ``create_*`` methods are instance methods, so they can't be
+        called directly from :py:meth:`setUpTestData`. This returns an
+        instance of the class that isn't bound to any particular test, which
+        can be used to call them when setting up data shared by all tests in
+        the class.
+
+        Objects created this way are shared across all tests in the class.
+        Changes made to them in the database during a test are rolled back
+        after that test, but changes made to the Python objects are not.
+        Tests that modify them should fetch their own copies from the
+        database.
+
+        Returns:
+            TestCase:
+            An instance of the class for calling the ``create_*`` methods.
+        """
+        # Any method name will do here. This just has to point to something
+        # that exists on the class.
+        helper = cls(methodName='setUp')
+        helper._local_sites = {}
+
+        return helper
+
+    @classmethod
+    def get_url_format(cls, url_name, url_kwargs, local_site_name=None):
+        """Return a format string for a URL.
+
+        Tests that request the same URL for many different objects can use
+        this to reverse the URL once, and then fill in the IDs with ``%``,
+        instead of going through the URL resolver for every request.
+
+        Args:
+            url_name (unicode):
+                The name of the URL pattern.
+
+            url_kwargs (list of unicode):
+                The names of the URL pattern's keyword arguments. Each must
+                accept a number.
+
+            local_site_name (unicode, optional):
+                The name of the Local Site for the URL.
+
+        Returns:
+            unicode:
+            The format string. It has a ``%s`` for each argument, in the
+            order the arguments appear in the URL.
+        """
+        placeholder = '987654321'
+        parts = local_site_reverse(
+            url_name,
+            local_site_name=local_site_name,
+            kwargs={
+                name: placeholder
+                for name in url_kwargs
+            }).split(placeholder)
+        assert len(parts) == len(url_kwargs) + 1
+
+        return '%s'.join(
+            part.replace('%', '%%')
+            for part in parts
+        )
+
+    def load_fixtures(self, fixtures, db=DEFAULT_DB_ALIAS):
+        """Load fixtures for the current test.
+
+        Fixtures listed in the class's :py:attr:`fixtures` are loaded once
+        by Django when setting up the class, and are rolled back only after
+        the last test in the class has run. Reloading them for every test
+        would be wasted work, and would also delete (through cascades) any
+        data created in :py:meth:`setUpTestData` that references them.
+
+        If :py:attr:`load_fixtures_once` is set, this will only load the
+        fixtures that a test adds on top of the class's fixtures (through
+        :py:func:`~djblets.testing.decorators.add_fixtures`). Otherwise,
+        all the given fixtures are loaded.
+
+        Args:
+            fixtures (list of unicode):
+                The list of fixtures to load.
+
+            db (unicode, optional):
+                The database name to load fixture data on.
+        """
+        if not self.load_fixtures_once:
+            super(TestCase, self).load_fixtures(fixtures, db=db)
+            return
+
+        class_fixtures = set(type(self).fixtures or [])
+
+        super(TestCase, self).load_fixtures(
+            [
+                fixture
+                for fixture in fixtures
+                if fixture not in class_fixtures
+            ],
+            db=db)
+
     def get_local_site_or_none(self, name):
         """Returns a LocalSite matching the name, if provided, or None."""
         if name:
@@ -9,6 +9,26 @@ from reviewboard.webapi.decorators import (webapi_check_login_required,
 from reviewboard.webapi.resources import WebAPIResource, resources
 
 
+#: The top-level resources linked to from the root resource.
+_ROOT_CHILD_RESOURCES = (
+    resources.default_reviewer,
+    resources.extension,
+    resources.hosting_service,
+    resources.hosting_service_account,
+    resources.oauth_app,
+    resources.oauth_token,
+    resources.repository,
+    resources.review_group,
+    resources.review_request,
+    resources.search,
+    resources.server_info,
+    resources.session,
+    resources.user,
+    resources.validation,
+    resources.webhook,
+)
+
+
 class RootResource(WebAPIResource, DjbletsRootResource):
     """Links to all the main resources, including URI templates to resources
     anywhere in the tree.
@@ -25,23 +45,10 @@ class RootResource(WebAPIResource, DjbletsRootResource):
     mimetype_vendor = 'reviewboard.org'
 
     def __init__(self, *args, **kwargs):
-        super(RootResource, self).__init__([
-            resources.default_reviewer,
-            resources.extension,
-            resources.hosting_service,
-            resources.hosting_service_account,
-            resources.oauth_app,
-            resources.oauth_token,
-            resources.repository,
-            resources.review_group,
-            resources.review_request,
-            resources.search,
-            resources.server_info,
-            resources.session,
-            resources.user,
-            resources.validation,
-            resources.webhook,
-        ], *args, **kwargs)
+        # The parent class stores this as list_child_resources, which callers
+        # expect to be a list owned by this instance.
+        super(RootResource, self).__init__(list(_ROOT_CHILD_RESOURCES),
+                                           *args, **kwargs)
 
     @webapi_check_login_required
     @webapi_check_local_site
@@ -2,18 +2,157 @@
 
 from __future__ import unicode_literals
 
+import multiprocessing
 import os
+import re
+import subprocess
 import sys
+import tempfile
+
+
+_SCRIPT_PATH = os.path.abspath(__file__)
+
+
+def _find_test_modules(top_dir):
+    """Return paths to all test modules within a directory.
+
+    Args:
+        top_dir (unicode):
+            The directory to search.
+
+    Returns:
+        list of unicode:
+        The sorted list of test module paths.
+    """
+    test_modules = []
+
+    for dirpath, dirnames, filenames in os.walk(top_dir):
+        # Skip static media, which contains JavaScript tests.
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if dirname not in ('htdocs', 'static', 'node_modules')
+        ]
+
+        test_modules += [
+            os.path.join(dirpath, filename)
+            for filename in filenames
+            if re.match(r'^(tests|test_\w+)\.py$', filename)
+        ]
+
+    return sorted(test_modules)
+
+
+def _run_parallel(num_workers, args):
+    """Run the test suite across several test runner processes.
+
+    Test modules are split between the workers, so that all tests in a module
+    run in the same process. Each worker is given its own ID in
+    :envvar:`RB_TEST_WORKER_ID`, which gives it its own test database.
+
+    Args:
+        num_workers (int):
+            The number of worker processes to run.
+
+        args (list of unicode):
+            The command line arguments. Options for the test runner come
+            first, and are passed to every worker. Any test labels to split
+            up must follow a ``--`` argument, so that they can't be confused
+            with option values. If there are no test labels, all test
+            modules are split up.
+
+    Returns:
+        int:
+        The exit code. 0 means all workers passed, while 1 means there were
+        failures.
+    """
+    if '--' in args:
+        i = args.index('--')
+        options = args[:i]
+        test_labels = args[i + 1:]
+    else:
+        options = args
+        test_labels = []
+
+    if not test_labels:
+        test_labels = _find_test_modules('reviewboard')
+
+    num_workers = min(num_workers, len(test_labels))
+    workers = []
+
+    for worker_id in range(num_workers):
+        env = os.environ.copy()
+        env[str('RB_TEST_WORKER_ID')] = str(worker_id)
+
+        # Capture output to a file, rather than a pipe, so that a worker
+        # can't block on a full pipe while we're waiting on another one.
+        output_fp = tempfile.TemporaryFile()
+        # Each worker needs its own file for nose's test IDs (--with-id),
+        # or they'd all overwrite the same .noseids file.
+        process = subprocess.Popen(
+            [sys.executable, _SCRIPT_PATH] + options +
+            ['--id-file=.noseids-%d' % worker_id] +
+            test_labels[worker_id::num_workers],
+            env=env,
+            stdout=output_fp,
+            stderr=subprocess.STDOUT)
+        workers.append((process, output_fp))
+
+    result = 0
+
+    for worker_id, (process, output_fp) in enumerate(workers):
+        if process.wait() != 0:
+            result = 1
+
+        output_fp.seek(0)
+        sys.stdout.write('==> Test worker %d <==\n' % worker_id)
+        sys.stdout.flush()
+
+        if hasattr(sys.stdout, 'buffer'):
+            sys.stdout.buffer.write(output_fp.read())
+        else:
+            sys.stdout.write(output_fp.read())
+
+        sys.stdout.flush()
+        output_fp.close()
+
+    return result
 
 
 if __name__ == '__main__':
     os.chdir(os.path.join(os.path.dirname(__file__), '..'))
     sys.path.insert(0, os.getcwd())
 
+    # Tests can be split up across several processes by passing
+    # --parallel=<num> (or --parallel for one per CPU). Any test labels must
+    # then come after a "--", following all other options. For example:
+    #
+    #     ./tests/runtests.py --parallel=4 -a '!slow' -- reviewboard.reviews
+    args = sys.argv[1:]
+    num_workers = None
+
+    for arg in args:
+        if arg == '--parallel' or arg.startswith('--parallel='):
+            args.remove(arg)
+
+            try:
+                num_workers = int(arg.split('=', 1)[1])
+            except IndexError:
+                num_workers = multiprocessing.cpu_count()
+            except ValueError:
+                sys.stderr.write('--parallel must be a number of '
+                                 'processes.\n')
+                sys.exit(1)
+
+            break
+
+    if num_workers is not None and num_workers > 1:
+        sys.exit(_run_parallel(num_workers, args))
+
     # We're just wrapping the manage script. Both that script and the test
     # runner are expecting sys.argv to be set. Fake it here so we don't have
     # to shell out to another process just to get a proper set of arguments.
-    sys.argv = [sys.argv[0], 'test', '--'] + sys.argv[1:]
+    sys.argv = [sys.argv[0], 'test', '--'] + args
 
     os.environ[str('RB_RUNNING_TESTS')] = str('1')
     os.environ[str('RBSSH_STORAGE_BACKEND')] = \